@@ -1,7 +1,11 @@
 #!/usr/bin/env python3
 # /// script
+# requires-python = ">=3.11"
 # dependencies = [
 #   "beautifulsoup4==4.12.3",
+#   "lxml==5.3.0",
+#   "orjson==3.10.12",
+#   "urllib3==2.2.3",
 # ]
 # ///
 """
@@ -9,7 +13,7 @@ Sync the snapcraft.json schema by parsing official Snapcraft documentation.
 
 This script:
 1. Fetches rendered HTML documentation from Ubuntu's Snapcraft docs
-2. Parses the semantic Sphinx HTML structure using BeautifulSoup
+2. Parses the semantic Sphinx HTML structure using lxml and BeautifulSoup
 3. Extracts field definitions, types, descriptions, and enums (from "One of:" and Values tables)
 4. Generates a complete JSON Schema with properly nested properties
 5. Updates the local schema file
@@ -23,6 +27,18 @@ The Sphinx HTML structure is predictable:
 
 Dependencies (inline - run with `uv run`):
     beautifulsoup4==4.12.3
+    lxml==5.3.0
+    orjson==3.10.12
+    urllib3==2.2.3
+
+Caching (opt-in, set SNAPCRAFT_SYNC_CACHE=1):
+    Responses are stored under .cache/snapcraft-sync and revalidated with
+    ETag/Last-Modified on later runs. A build stamp in the same directory
+    records the sources, script and schema of the last sync; when every
+    source answers 304 Not Modified and the stamp still matches, the build
+    is skipped. The sync-schema workflow enables this and persists the
+    directory with actions/cache; that is best-effort, since GitHub evicts
+    entries unused for 7 days and the weekly run may start cold.
 
 IMPORTANT: This script has NO fallback values. If parsing fails, it will exit
 with an error. This is intentional - if documentation changes, we need to update
@@ -31,28 +47,42 @@ the parser, not silently use stale data.
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
+import logging
+import os
 import re
 import sys
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
-from urllib.error import HTTPError, URLError
-from urllib.request import HTTPRedirectHandler, Request, build_opener
+from typing import Any, NamedTuple
+from urllib.parse import urljoin
 
 try:
-    from bs4 import BeautifulSoup, Tag
+    import orjson
+    import urllib3
+    from bs4 import BeautifulSoup, SoupStrainer
+    from lxml import etree
+    from lxml import html as lxml_html
+    from lxml.html import HtmlElement
 except ImportError:
-    print("❌ Error: BeautifulSoup4 is required. Install with: pip install beautifulsoup4")
+    print(
+        "❌ Error: BeautifulSoup4, lxml, orjson and urllib3 are required. "
+        "Install with: pip install beautifulsoup4 lxml orjson urllib3"
+    )
     sys.exit(1)
 
 
+logger = logging.getLogger("snapsync")
+
+
 # =============================================================================
 # Configuration
 # =============================================================================
 
-@dataclass(frozen=True)
-class DocumentationURLs:
+class DocumentationURLs(NamedTuple):
     """URLs for schema source documentation."""
 
     main: str = "https://documentation.ubuntu.com/snapcraft/stable/reference/project-file/snapcraft-yaml/"
@@ -62,8 +92,7 @@ class DocumentationURLs:
     interfaces: str = "https://snapcraft.io/docs/supported-interfaces"
 
 
-@dataclass(frozen=True)
-class ValidationThresholds:
+class ValidationThresholds(NamedTuple):
     """Minimum expected counts for sanity checks."""
 
     plugins: int = 15
@@ -84,7 +113,7 @@ VALID_ARCHITECTURES = frozenset([
 # Data Classes
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class PropertySchema:
     """Represents a parsed property schema."""
 
@@ -92,9 +121,17 @@ class PropertySchema:
     type_schema: dict[str, Any] = field(default_factory=dict)
     description: str = ""
     enum_values: list[str] = field(default_factory=list)
+    _json_schema: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
 
     def to_json_schema(self) -> dict[str, Any]:
-        """Convert to JSON Schema format."""
+        """Convert to JSON Schema format.
+
+        The result is computed once and the same dict is returned on later
+        calls, so only call this after the property is fully parsed.
+        """
+        if self._json_schema is not None:
+            return self._json_schema
+
         schema: dict[str, Any] = {}
 
         if self.enum_values:
@@ -108,10 +145,11 @@ class PropertySchema:
         if self.description:
             schema["description"] = self.description
 
+        self._json_schema = schema
         return schema
 
 
-@dataclass
+@dataclass(slots=True)
 class SchemaDefinition:
     """Represents a $defs entry for nested types."""
 
@@ -130,65 +168,211 @@ class SchemaDefinition:
         }
 
 
+@dataclass(slots=True)
+class CategorizedProperties:
+    """Property schemas grouped by category, keyed by prefix-stripped name."""
+
+    top_level: dict[str, dict[str, Any]] = field(default_factory=dict)
+    apps: dict[str, dict[str, Any]] = field(default_factory=dict)
+    parts: dict[str, dict[str, Any]] = field(default_factory=dict)
+    platforms: dict[str, dict[str, Any]] = field(default_factory=dict)
+    architectures: dict[str, dict[str, Any]] = field(default_factory=dict)
+    sockets: dict[str, dict[str, Any]] = field(default_factory=dict)
+    hooks: dict[str, dict[str, Any]] = field(default_factory=dict)
+    components: dict[str, dict[str, Any]] = field(default_factory=dict)
+    plugs: dict[str, dict[str, Any]] = field(default_factory=dict)
+    slots: dict[str, dict[str, Any]] = field(default_factory=dict)
+    permissions: dict[str, dict[str, Any]] = field(default_factory=dict)
+    lint: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+
 # =============================================================================
 # HTTP Utilities
 # =============================================================================
 
+class FetchError(Exception):
+    """A documentation page could not be fetched.
+
+    Raised inside fetch workers and reported by HTTPClient.result() where the
+    page is actually consumed.
+    """
+
+    def __init__(self, url: str, message: str, status: int | None = None):
+        report = f"{message}\n   URL: {url}"
+        if status is not None:
+            report += "\n   Documentation may have moved. Please update the URL."
+        super().__init__(report)
+        self.url = url
+        self.status = status
+
+
 class HTTPClient:
     """Simple HTTP client for fetching documentation pages."""
 
     USER_AGENT = "Mozilla/5.0 (compatible; SnapcraftSchemaSync/2.0)"
     TIMEOUT = 30
+    MAX_WORKERS = 6
+
+    # Separate budgets: total would otherwise count redirects against the
+    # 3 connection retries (urllib.request followed up to 10 redirects).
+    # Passed per request, since PoolManager follows redirects with the
+    # request's own retries rather than the pool default.
+    RETRIES = urllib3.Retry(total=None, connect=3, read=3, other=3, redirect=10, backoff_factor=0.2)
+
+    # Shared connection pool so repeated requests to a host reuse TCP/TLS connections
+    _POOL = urllib3.PoolManager(maxsize=MAX_WORKERS, retries=RETRIES, timeout=TIMEOUT)
+    # Background workers so pages can download while the caller parses others
+    _EXECUTOR = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="fetch")
+
+    # Opt-in on-disk cache for local iteration (revalidated with ETag/Last-Modified)
+    CACHE_ENABLED = os.environ.get("SNAPCRAFT_SYNC_CACHE") == "1"
+    CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "snapcraft-sync"
+
+    # Per-run bookkeeping: in-flight prefetches, the (ETag, Last-Modified) pair
+    # each URL was served with, and which URLs were answered 304 Not Modified
+    _PENDING: dict[str, Future[bytes]] = {}
+    _VALIDATORS: dict[str, tuple[str | None, str | None]] = {}
+    _NOT_MODIFIED: set[str] = set()
 
     @classmethod
-    def fetch(cls, url: str) -> str:
+    def fetch(cls, url: str) -> bytes:
         """
         Fetch HTML content from URL with redirect handling.
 
+        When SNAPCRAFT_SYNC_CACHE=1, responses are cached on disk and
+        revalidated with a conditional GET on later runs.
+
         Args:
             url: The URL to fetch
 
         Returns:
-            The HTML content as a string
+            The raw response body (decoding is left to the parser)
 
         Raises:
-            SystemExit: If fetch fails
+            FetchError: If fetch fails
         """
-        print(f"📥 Fetching: {url}")
+        logger.info(f"📥 Fetching: {url}")
+        cached = cls._load_cached(url) if cls.CACHE_ENABLED else None
+        headers = {"User-Agent": cls.USER_AGENT}
+        if cached:
+            _, meta = cached
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
         try:
-            opener = build_opener(HTTPRedirectHandler)
-            request = Request(url, headers={"User-Agent": cls.USER_AGENT})
+            response = cls._POOL.request("GET", url, headers=headers, retries=cls.RETRIES)
+        except urllib3.exceptions.HTTPError as e:
+            raise FetchError(url, f"❌ Network Error: {e}") from e
+        except Exception as e:
+            raise FetchError(url, f"❌ Unexpected error: {e}") from e
+
+        if response.status == 304 and cached:
+            logger.info("   ✓ Not modified, using cached copy")
+            cls._VALIDATORS[url] = (meta.get("etag"), meta.get("last_modified"))
+            cls._NOT_MODIFIED.add(url)
+            return cached[0]
+        if response.status >= 400:
+            raise FetchError(
+                url,
+                f"❌ HTTP Error {response.status}: {response.reason}",
+                response.status,
+            )
 
-            with opener.open(request, timeout=cls.TIMEOUT) as response:
-                final_url = response.geturl()
-                if final_url != url:
-                    print(f"   ↪ Redirected to: {final_url}")
-                return response.read().decode("utf-8")
+        if response.retries and response.retries.history:
+            last = response.retries.history[-1]
+            if last.redirect_location:
+                logger.info(f"   ↪ Redirected to: {urljoin(last.url, last.redirect_location)}")
+        content = response.data
+        cls._VALIDATORS[url] = (response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        if cls.CACHE_ENABLED:
+            cls._store_cached(url, content, response.headers)
+        return content
 
-        except HTTPError as e:
-            cls._handle_http_error(url, e)
-            raise SystemExit(1) from e
-        except URLError as e:
-            print(f"❌ Network Error: {e.reason}\n   URL: {url}")
-            raise SystemExit(1) from e
-        except Exception as e:
-            print(f"❌ Unexpected error: {e}\n   URL: {url}")
-            raise SystemExit(1) from e
+    @classmethod
+    def prefetch(cls, urls: list[str]) -> dict[str, Future[bytes]]:
+        """
+        Start fetching several URLs in the background.
+
+        URLs that were already prefetched share the existing download.
+
+        Args:
+            urls: The URLs to fetch
+
+        Returns:
+            Mapping of each URL to a future resolving to its raw response body;
+            read it with HTTPClient.result()
+        """
+        for url in urls:
+            if url not in cls._PENDING:
+                cls._PENDING[url] = cls._EXECUTOR.submit(cls.fetch, url)
+        return {url: cls._PENDING[url] for url in urls}
 
     @staticmethod
-    def _handle_http_error(url: str, error: HTTPError) -> None:
-        """Handle HTTP errors with helpful messages.
+    def result(page: Future[bytes]) -> bytes:
+        """
+        Wait for a prefetched page.
 
         Args:
-            url: The URL that failed
-            error: The HTTP error that occurred
+            page: A future returned by prefetch()
+
+        Returns:
+            The raw response body
 
         Raises:
-            SystemExit: Always exits with code 1
+            SystemExit: If the fetch failed (the error is logged first)
         """
-        print(f"❌ HTTP Error {error.code}: {error.reason}")
-        print(f"   URL: {url}")
-        print("   Documentation may have moved. Please update the URL.")
+        try:
+            return page.result()
+        except FetchError as e:
+            logger.error(str(e))
+            raise SystemExit(1) from e
+
+    @classmethod
+    def validators(cls, url: str) -> tuple[str | None, str | None] | None:
+        """Return the (ETag, Last-Modified) pair a URL was served with this run."""
+        return cls._VALIDATORS.get(url)
+
+    @classmethod
+    def not_modified(cls, url: str) -> bool:
+        """Return whether a URL was answered 304 Not Modified this run."""
+        return url in cls._NOT_MODIFIED
+
+    @classmethod
+    def _cache_paths(cls, url: str) -> tuple[Path, Path]:
+        """Return the (body, metadata) cache file paths for a URL."""
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return cls.CACHE_DIR / f"{key}.html", cls.CACHE_DIR / f"{key}.json"
+
+    @classmethod
+    def _load_cached(cls, url: str) -> tuple[bytes, dict[str, str]] | None:
+        """Load a cached response body and its validators, if present."""
+        body_path, meta_path = cls._cache_paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            return body_path.read_bytes(), meta
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    @classmethod
+    def _store_cached(cls, url: str, content: bytes, headers: Any) -> None:
+        """Store a response body with its ETag/Last-Modified validators."""
+        meta = {
+            "url": url,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+        }
+        if not meta["etag"] and not meta["last_modified"]:
+            return
+
+        body_path, meta_path = cls._cache_paths(url)
+        try:
+            cls.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            body_path.write_bytes(content)
+            meta_path.write_text(json.dumps(meta), encoding="utf-8")
+        except OSError as e:
+            logger.warning(f"   ⚠️  Failed to cache response: {e}")
 
 
 # =============================================================================
@@ -218,8 +402,10 @@ class TypeParser:
     DICT_PATTERN = re.compile(r"dict\[([^,]+),\s*(.+)\]", re.IGNORECASE)
     LIST_PATTERN = re.compile(r"list\[(.+)\]", re.IGNORECASE)
     SET_PATTERN = re.compile(r"set\[(.+)\]", re.IGNORECASE)
+    QUOTED_VALUE_PATTERN = re.compile(r"'([^']+)'")
 
     @classmethod
+    @functools.lru_cache(maxsize=512)
     def parse(cls, type_str: str) -> dict[str, Any]:
         """
         Parse a type string into JSON Schema format.
@@ -229,12 +415,14 @@ class TypeParser:
         - Union types: "str | list[str]" -> anyOf
         - Complex types: dict[str, Any], list[str], set[str]
         - Basic types: str, int, bool, etc.
+
+        Results are cached and shared between callers, so copy before mutating.
         """
         type_str = type_str.strip()
 
         # Handle "One of:" enum pattern
         if match := cls.ONE_OF_PATTERN.match(type_str):
-            values = re.findall(r"'([^']+)'", match.group(1))
+            values = cls.QUOTED_VALUE_PATTERN.findall(match.group(1))
             if values:
                 return {"type": "string", "enum": values}
 
@@ -307,34 +495,57 @@ class PropertyExtractor:
 
     # Keywords that indicate non-property headings
     SKIP_KEYWORDS = frozenset({"example", "see also", "note"})
+    SKIP_KEYWORDS_PATTERN = re.compile("|".join(map(re.escape, sorted(SKIP_KEYWORDS))))
+
+    # Header cells of Values tables
+    TABLE_SKIP_VALUES = frozenset({"value", "values", "name", ""})
 
-    def __init__(self, html_content: str):
-        self.soup = BeautifulSoup(html_content, "html.parser")
+    WHITESPACE_PATTERN = re.compile(r"\s+")
+
+    # Property headings, in document order
+    HEADINGS_XPATH = etree.XPath(".//*[self::h2 or self::h3 or self::h4]")
+
+    HTML_PARSER = lxml_html.HTMLParser(encoding="utf-8")
+
+    def __init__(self, html_content: bytes):
+        try:
+            self.tree = lxml_html.document_fromstring(html_content, parser=self.HTML_PARSER)
+        except etree.ParserError:
+            # Empty or whitespace-only body: extract nothing and let the
+            # caller's property-count check report it
+            self.tree = lxml_html.Element("html")
         self.main_content = (
-            self.soup.find("main") or
-            self.soup.find("article") or
-            self.soup
-        )
+            self.tree.xpath("(//main)[1]") or
+            self.tree.xpath("(//article)[1]") or
+            [self.tree]
+        )[0]
 
     def extract_all(self) -> dict[str, PropertySchema]:
         """Extract all property definitions from the HTML."""
         properties: dict[str, PropertySchema] = {}
 
-        for heading in self.main_content.find_all(["h2", "h3", "h4"]):
+        for heading in self.HEADINGS_XPATH(self.main_content):
             prop = self._extract_property(heading)
             if prop:
                 properties[prop.name] = prop
 
         return properties
 
-    def _extract_property(self, heading: Tag) -> PropertySchema | None:
+    @staticmethod
+    def _text(element: HtmlElement, separator: str = "") -> str:
+        """Join the element's stripped text nodes (like BeautifulSoup's get_text(strip=True))."""
+        return separator.join(text for text in map(str.strip, element.itertext()) if text)
+
+    def _extract_property(self, heading: HtmlElement) -> PropertySchema | None:
         """Extract a single property definition from a heading element."""
-        heading_text = heading.get_text(strip=True).replace("¶", "").strip()
+        heading_text = self._text(heading).replace("¶", "").strip()
+
+        heading_lower = heading_text.lower()
 
         # Skip invalid headings
-        if not heading_text or heading_text.lower() in self.SKIP_HEADERS:
+        if not heading_text or heading_lower in self.SKIP_HEADERS:
             return None
-        if any(kw in heading_text.lower() for kw in self.SKIP_KEYWORDS):
+        if self.SKIP_KEYWORDS_PATTERN.search(heading_lower):
             return None
 
         prop = PropertySchema(name=heading_text)
@@ -342,24 +553,27 @@ class PropertyExtractor:
 
         return prop
 
-    def _parse_property_content(self, heading: Tag, prop: PropertySchema) -> None:
+    def _parse_property_content(self, heading: HtmlElement, prop: PropertySchema) -> None:
         """Parse the content following a property heading."""
-        current = heading.find_next_sibling()
         expecting_type = False
         expecting_desc = False
         found_type = False
         found_desc = False
 
-        while current:
+        for current in heading.itersiblings():
+            # Skip comments and processing instructions
+            if not isinstance(current.tag, str):
+                continue
+
             # Stop at next heading
-            if current.name in ("h2", "h3", "h4"):
+            if current.tag in ("h2", "h3", "h4"):
                 break
 
-            if current.name == "p":
+            if current.tag == "p":
                 # Check for labels first
-                strong = current.find("strong")
-                if strong:
-                    label = strong.get_text(strip=True).lower()
+                strong = current.find(".//strong")
+                if strong is not None:
+                    label = self._text(strong).lower()
                     if label == "type":
                         expecting_type, expecting_desc = True, False
                     elif label == "description":
@@ -369,20 +583,19 @@ class PropertyExtractor:
                         expecting_type, expecting_desc = False, False
                 else:
                     # Process content based on current state
-                    text = current.get_text(strip=True)
+                    text = self._text(current)
 
                     if expecting_type and not found_type:
                         # Extract type value
                         if text.lower().startswith("one of:"):
                             type_text = text
                         else:
-                            codes = current.find_all("code")
                             type_text = " ".join(
-                                c.get_text(strip=True) for c in codes if c.get_text(strip=True)
-                            ) if codes else text
+                                filter(None, map(self._text, current.iter("code")))
+                            ) or text
 
                         if type_text:
-                            prop.type_schema = TypeParser.parse(type_text)
+                            prop.type_schema = dict(TypeParser.parse(type_text))
                             found_type = True
                             expecting_type = False
 
@@ -394,67 +607,66 @@ class PropertyExtractor:
                             found_desc = True
                             expecting_desc = False
 
-            elif current.name == "table":
+            elif current.tag == "table":
                 # Parse Values table for enum values
                 enum_values = self._extract_table_values(current)
                 if enum_values and not prop.enum_values:
                     prop.enum_values = enum_values
 
-            elif current.name == "div":
+            elif current.tag == "div":
                 # Tables may be wrapped in div.table-wrapper containers
-                table = current.find("table")
-                if table:
+                table = current.find(".//table")
+                if table is not None:
                     enum_values = self._extract_table_values(table)
                     if enum_values and not prop.enum_values:
                         prop.enum_values = enum_values
 
-            elif current.name == "dl":
+            elif current.tag == "dl":
                 # Fallback for definition list format
                 self._process_definition_list(current, prop)
 
-            current = current.find_next_sibling()
-
         # Ensure type is set
         if not prop.type_schema and not prop.enum_values:
             prop.type_schema = {"type": "string"}
 
-    def _extract_table_values(self, table: Tag) -> list[str]:
+    def _extract_table_values(self, table: HtmlElement) -> list[str]:
         """Extract enum values from a Values table."""
-        values = []
-        skip_values = {"value", "values", "name", ""}
-
-        for row in table.find_all("tr"):
-            cells = row.find_all(["td", "th"])
-            if cells:
-                value = cells[0].get_text(strip=True)
-                if value and value.lower() not in skip_values:
+        values: set[str] = set()
+
+        for row in table.iter("tr"):
+            cell = next(row.iter("td", "th"), None)
+            if cell is not None:
+                value = self._text(cell)
+                if value.lower() not in self.TABLE_SKIP_VALUES:
                     # Clean up the value - take first word if contains space
                     # Some tables have "value Description" format
-                    clean_value = value.split()[0] if " " in value else value
-                    if clean_value not in values:
-                        values.append(clean_value)
+                    values.add(value.split(maxsplit=1)[0] if " " in value else value)
 
         return sorted(values)
 
-    def _process_definition_list(self, dl: Tag, prop: PropertySchema) -> None:
+    def _process_definition_list(self, dl: HtmlElement, prop: PropertySchema) -> None:
         """Process a definition list element (fallback format)."""
-        for dt in dl.find_all("dt", recursive=False):
-            label = dt.get_text(strip=True).lower()
-            dd = dt.find_next_sibling("dd")
-            if not dd:
+        for dt in dl.findall("dt"):
+            label = self._text(dt).lower()
+            wants_type = label == "type" and not prop.type_schema
+            wants_desc = label == "description" and not prop.description
+            if not (wants_type or wants_desc):
                 continue
 
-            if label == "type" and not prop.type_schema:
-                codes = dd.find_all("code")
+            dd = next(dt.itersiblings("dd"), None)
+            if dd is None:
+                continue
+
+            if wants_type:
                 type_text = (
-                    " ".join(c.get_text(strip=True) for c in codes if c.get_text(strip=True))
-                    if codes else dd.get_text(strip=True)
+                    " ".join(filter(None, map(self._text, dd.iter("code"))))
+                    or self._text(dd)
                 )
                 if type_text:
-                    prop.type_schema = TypeParser.parse(type_text)
+                    prop.type_schema = dict(TypeParser.parse(type_text))
 
-            elif label == "description" and not prop.description:
-                desc = re.sub(r"\s+", " ", dd.get_text(separator=" ", strip=True))
+            else:
+                desc = self.WHITESPACE_PATTERN.sub(" ", self._text(dd, separator=" "))
                 prop.description = desc[:497] + "..." if len(desc) > 500 else desc
 
 
@@ -465,10 +677,14 @@ class PluginParser:
     # Handles both absolute and relative URLs
     PLUGIN_URL_PATTERN = re.compile(r"(?:^|/)([a-z0-9_]+)_plugin/?$", re.IGNORECASE)
 
+    PARSE_ONLY = SoupStrainer("a", href=True)
+
     @classmethod
-    def parse(cls, html_content: str, min_expected: int) -> list[str]:
+    def parse(cls, html_content: bytes, min_expected: int) -> list[str]:
         """Parse and validate plugin names from URLs."""
-        soup = BeautifulSoup(html_content, "html.parser")
+        soup = BeautifulSoup(
+            html_content, "lxml", parse_only=cls.PARSE_ONLY, from_encoding="utf-8"
+        )
         plugins = set()
 
         for link in soup.find_all("a", href=True):
@@ -495,21 +711,24 @@ class PluginParser:
 class BaseParser:
     """Parses base snap names from the bases documentation page."""
 
-    BASE_PATTERN = re.compile(r"^(core\d*|bare|devel)$")
+    # Matched line-by-line against the joined first cells of every table row;
+    # newlines inside a cell are flattened first so each line is a whole cell
+    BASE_PATTERN = re.compile(r"^(?:core\d*|bare|devel)$", re.MULTILINE)
+
+    PARSE_ONLY = SoupStrainer("table")
 
     @classmethod
-    def parse(cls, html_content: str, min_expected: int) -> list[str]:
+    def parse(cls, html_content: bytes, min_expected: int) -> list[str]:
         """Parse and validate base names."""
-        soup = BeautifulSoup(html_content, "html.parser")
-        bases = set()
-
-        for table in soup.find_all("table"):
-            for row in table.find_all("tr"):
-                cells = row.find_all(["td", "th"])
-                if cells:
-                    text = cells[0].get_text(strip=True)
-                    if cls.BASE_PATTERN.match(text):
-                        bases.add(text)
+        soup = BeautifulSoup(
+            html_content, "lxml", parse_only=cls.PARSE_ONLY, from_encoding="utf-8"
+        )
+        first_cells = [
+            cell.get_text(strip=True).replace("\n", " ")
+            for row in soup.find_all("tr")
+            if (cell := row.find(["td", "th"])) is not None
+        ]
+        bases = set(cls.BASE_PATTERN.findall("\n".join(first_cells)))
 
         result = sorted(bases)
         if len(result) < min_expected:
@@ -521,14 +740,22 @@ class BaseParser:
 
 
 class ExtensionParser:
-    """Fetches extension names from canonical/snapcraft registry.py (source of truth)."""
+    """Fetches extension names from canonical/snapcraft registry.py (source of truth).
+
+    Unlike the other parsers this one never builds an HTML tree: registry.py
+    is scanned with a regex and the legacy schema is plain JSON.
+    """
 
     # GitHub raw URLs for the registry files
     REGISTRY_URL = "https://raw.githubusercontent.com/canonical/snapcraft/main/snapcraft/extensions/registry.py"
     LEGACY_SCHEMA_URL = "https://raw.githubusercontent.com/canonical/snapcraft/main/schema/snapcraft-legacy.json"
 
+    # Keys of the _EXTENSIONS dictionary, e.g. "extension-name": SomeExtensionClass,
+    # Bytes pattern so the raw file body is scanned without decoding it first
+    EXTENSION_PATTERN = re.compile(rb'"([a-z0-9-]+)"\s*:', re.MULTILINE)
+
     @classmethod
-    def parse(cls, html_content: str, min_expected: int) -> list[str]:
+    def parse(cls, html_content: bytes, min_expected: int) -> list[str]:
         """Fetch extension names from canonical/snapcraft registry files.
 
         Fetches from two sources:
@@ -546,25 +773,31 @@ class ExtensionParser:
         modern_count = 0
         legacy_count = 0
 
+        # Both sources are independent, so fetch them concurrently (main() may
+        # already have started them)
+        sources = HTTPClient.prefetch([cls.REGISTRY_URL, cls.LEGACY_SCHEMA_URL])
+        registry_future = sources[cls.REGISTRY_URL]
+        legacy_future = sources[cls.LEGACY_SCHEMA_URL]
+
         # Fetch modern extensions from registry.py
         try:
-            print("  Fetching modern extensions from registry.py")
-            registry_content = HTTPClient.fetch(cls.REGISTRY_URL)
+            logger.info("  Fetching modern extensions from registry.py")
+            registry_content = HTTPClient.result(registry_future)
 
             # Parse the _EXTENSIONS dictionary using regex
-            # Pattern: "extension-name": SomeExtensionClass,
-            extension_pattern = re.compile(r'"([a-z0-9-]+)"\s*:', re.MULTILINE)
-            modern_extensions = set(extension_pattern.findall(registry_content))
+            modern_extensions = {
+                name.decode("ascii") for name in cls.EXTENSION_PATTERN.findall(registry_content)
+            }
             extensions.update(modern_extensions)
             modern_count = len(modern_extensions)
-            print(f"  Found {modern_count} modern extensions")
-        except (HTTPError, URLError, OSError) as e:
-            print(f"  ⚠️  Failed to fetch modern extensions: {e}")
+            logger.info(f"  Found {modern_count} modern extensions")
+        except (urllib3.exceptions.HTTPError, OSError) as e:
+            logger.warning(f"  ⚠️  Failed to fetch modern extensions: {e}")
 
         # Fetch legacy extensions from snapcraft-legacy.json
         try:
-            print("  Fetching legacy extensions from snapcraft-legacy.json")
-            legacy_schema = HTTPClient.fetch(cls.LEGACY_SCHEMA_URL)
+            logger.info("  Fetching legacy extensions from snapcraft-legacy.json")
+            legacy_schema = HTTPClient.result(legacy_future)
             legacy_data = json.loads(legacy_schema)
 
             # Find extensions enum in the schema
@@ -572,11 +805,11 @@ class ExtensionParser:
             if legacy_extensions:
                 extensions.update(legacy_extensions)
                 legacy_count = len(legacy_extensions)
-                print(f"  Found {legacy_count} legacy extensions")
+                logger.info(f"  Found {legacy_count} legacy extensions")
             else:
-                print("  ⚠️  No extensions found in legacy schema")
-        except (HTTPError, URLError, OSError, json.JSONDecodeError) as e:
-            print(f"  ⚠️  Failed to fetch legacy extensions: {e}")
+                logger.warning("  ⚠️  No extensions found in legacy schema")
+        except (urllib3.exceptions.HTTPError, OSError, json.JSONDecodeError) as e:
+            logger.warning(f"  ⚠️  Failed to fetch legacy extensions: {e}")
 
         result = sorted(extensions)
         if len(result) < min_expected:
@@ -585,32 +818,35 @@ class ExtensionParser:
                 f"expected at least {min_expected}. Repository structure may have changed."
             )
 
-        print(f"  ✅ Total: {len(result)} extensions (modern: {modern_count}, legacy: {legacy_count})")
+        logger.info(f"  ✅ Total: {len(result)} extensions (modern: {modern_count}, legacy: {legacy_count})")
         return result
 
     @classmethod
-    def _extract_legacy_extensions(cls, schema: dict | list, path: str = '') -> set[str]:
-        """Recursively extract extension names from legacy schema's enum values.
+    def _extract_legacy_extensions(cls, schema: dict | list) -> set[str]:
+        """Extract extension names from legacy schema's enum values.
+
+        Walks the schema depth-first with an explicit stack, tracking whether
+        any key on the path so far mentions 'extension'.
 
         Args:
             schema: The JSON schema dictionary or list to search
-            path: Current path in the schema (for 'extension' keyword detection)
 
         Returns:
             Set of extension names found in enum values
         """
         extensions: set[str] = set()
-
-        if isinstance(schema, dict):
-            # Check if this is an extensions enum
-            if 'enum' in schema and 'extension' in path.lower():
-                extensions.update(schema['enum'])
-            # Recursively search through the schema
-            for key, value in schema.items():
-                extensions.update(cls._extract_legacy_extensions(value, f'{path}.{key}'))
-        elif isinstance(schema, list):
-            for item in schema:
-                extensions.update(cls._extract_legacy_extensions(item, path))
+        stack: list[tuple[Any, bool]] = [(schema, False)]
+
+        while stack:
+            node, in_extension = stack.pop()
+            if isinstance(node, dict):
+                # Check if this is an extensions enum
+                if in_extension and 'enum' in node:
+                    extensions.update(node['enum'])
+                for key, value in node.items():
+                    stack.append((value, in_extension or 'extension' in key.lower()))
+            elif isinstance(node, list):
+                stack.extend((item, in_extension) for item in node)
 
         return extensions
 
@@ -620,19 +856,23 @@ class InterfaceParser:
 
     SKIP_VALUES = frozenset({"interface", "name", ""})
 
+    PARSE_ONLY = SoupStrainer("table")
+
     @classmethod
-    def parse(cls, html_content: str, min_expected: int) -> list[str]:
+    def parse(cls, html_content: bytes, min_expected: int) -> list[str]:
         """Parse and validate interface names."""
-        soup = BeautifulSoup(html_content, "html.parser")
+        soup = BeautifulSoup(
+            html_content, "lxml", parse_only=cls.PARSE_ONLY, from_encoding="utf-8"
+        )
         interfaces = set()
 
         for table in soup.find_all("table"):
             for row in table.find_all("tr"):
-                cells = row.find_all(["td", "th"])
-                if len(cells) >= 2:
+                cells = row.find_all(["td", "th"], limit=2)
+                if len(cells) == 2:
                     name = cells[0].get_text(strip=True)
-                    if name and name.lower() not in cls.SKIP_VALUES:
-                        interfaces.add(name.strip())
+                    if name.lower() not in cls.SKIP_VALUES:
+                        interfaces.add(name)
 
         result = sorted(interfaces)
         if len(result) < min_expected:
@@ -651,7 +891,7 @@ class SchemaBuilder:
     """Builds JSON Schema from extracted properties."""
 
     # Property path prefixes for categorization
-    PREFIX_MAPPINGS = [
+    PREFIX_MAPPINGS = (
         ("apps.<app-name>.sockets.<socket-name>.", "sockets"),
         ("sockets.<socket-name>.", "sockets"),
         ("apps.<app-name>.", "apps"),
@@ -665,25 +905,41 @@ class SchemaBuilder:
         ("plugs.<plug-name>.", "plugs"),
         ("slots.<slot-name>.", "slots"),
         ("lint.", "lint"),
-    ]
+    )
+
+    # One alternation over all prefixes, tried in PREFIX_MAPPINGS order; the
+    # index of the matching group selects the category
+    PREFIX_PATTERN = re.compile("|".join(f"({re.escape(prefix)})" for prefix, _ in PREFIX_MAPPINGS))
+    PREFIX_CATEGORIES = tuple(category for _, category in PREFIX_MAPPINGS)
+
+    # Prefixes without a placeholder (e.g. "lint."), which even "<"-free paths can match
+    PLAIN_PREFIXES = tuple(prefix for prefix, _ in PREFIX_MAPPINGS if "<" not in prefix)
+
+    # Definitions built straight from one category: (name, category, description, allow_additional)
+    LEAF_DEFINITIONS = (
+        ("Socket", "sockets", "Socket configuration for app activation", False),
+        ("Hook", "hooks", "Hook configuration", False),
+        ("Permissions", "permissions", "File permission settings", False),
+        ("Lint", "lint", "Linting configuration", False),
+        ("Platform", "platforms", "Platform/architecture configuration", False),
+        ("Architecture", "architectures", "Architecture configuration", False),
+        ("ContentPlug", "plugs", "Content interface plug definition", True),
+    )
+
+    # Top-level keys that map to a definition: (key, definition, description)
+    REF_MAPPINGS = (
+        ("apps", "App", "Application definitions"),
+        ("parts", "Part", "Part definitions for building the snap"),
+        ("hooks", "Hook", "Lifecycle hooks"),
+        ("components", "Component", "Snap components"),
+    )
+
+    __slots__ = ("properties", "docs_url", "categorized")
 
     def __init__(self, properties: dict[str, PropertySchema], docs_url: str):
         self.properties = properties
         self.docs_url = docs_url
-        self.categorized: dict[str, dict[str, dict[str, Any]]] = {
-            "top_level": {},
-            "apps": {},
-            "parts": {},
-            "platforms": {},
-            "architectures": {},
-            "sockets": {},
-            "hooks": {},
-            "components": {},
-            "plugs": {},
-            "slots": {},
-            "permissions": {},
-            "lint": {},
-        }
+        self.categorized = CategorizedProperties()
 
     def build(self) -> dict[str, Any]:
         """Build the complete JSON Schema."""
@@ -709,100 +965,100 @@ class SchemaBuilder:
 
     def _categorize_properties(self) -> None:
         """Categorize properties by their path prefix."""
+        # Bound once; this loop runs for every documented property
+        classify = self._classify
+        categorized = self.categorized
+        intern = sys.intern
         for path, prop in self.properties.items():
-            category = self._get_category(path)
-            if category:
-                name = self._strip_prefix(path)
-                # Skip doubly nested properties (except for specific cases)
-                if ".<" not in name:
-                    self.categorized[category][name] = prop.to_json_schema()
-
-    def _get_category(self, path: str) -> str | None:
-        """Determine the category for a property path."""
-        for prefix, category in self.PREFIX_MAPPINGS:
-            if path.startswith(prefix):
-                return category
+            category, name = classify(path)
+            # Skip doubly nested properties (except for specific cases)
+            if category and ".<" not in name:
+                # Interned so later lookups by literal key hit the identity fast path
+                getattr(categorized, category)[intern(name)] = prop.to_json_schema()
 
-        # Top-level if no nested placeholder
-        if ".<" not in path and "<" not in path:
-            return "top_level"
-        return None
+    def _classify(self, path: str) -> tuple[str | None, str]:
+        """Determine the category for a property path and strip its prefix."""
+        # Fast path: plain top-level keys skip the prefix match entirely
+        if "<" not in path and not path.startswith(self.PLAIN_PREFIXES):
+            return "top_level", path
+
+        if match := self.PREFIX_PATTERN.match(path):
+            return self.PREFIX_CATEGORIES[match.lastindex - 1], path[match.end():]
 
-    def _strip_prefix(self, path: str) -> str:
-        """Remove the prefix from a property path."""
-        for prefix, _ in self.PREFIX_MAPPINGS:
-            if path.startswith(prefix):
-                return path[len(prefix):]
-        return path
+        # Top-level if no nested placeholder
+        return ("top_level" if "<" not in path else None), path
 
     def _build_definitions(self) -> dict[str, dict[str, Any]]:
         """Build the $defs section."""
         defs: dict[str, dict[str, Any]] = {}
 
-        definitions = [
-            ("Socket", "sockets", "Socket configuration for app activation", False),
-            ("Hook", "hooks", "Hook configuration", False),
-            ("Permissions", "permissions", "File permission settings", False),
-            ("Lint", "lint", "Linting configuration", False),
-            ("Platform", "platforms", "Platform/architecture configuration", False),
-            ("Architecture", "architectures", "Architecture configuration", False),
-            ("ContentPlug", "plugs", "Content interface plug definition", True),
-        ]
-
-        for name, category, description, allow_additional in definitions:
-            if self.categorized[category]:
+        for name, category, description, allow_additional in self.LEAF_DEFINITIONS:
+            category_props = getattr(self.categorized, category)
+            if category_props:
                 defs[name] = SchemaDefinition(
                     name=name,
                     description=description,
-                    properties=self.categorized[category],
+                    properties=category_props,
                     additional_properties=allow_additional,
                 ).to_json_schema()
 
         # Special handling for Component (needs hooks reference)
-        if self.categorized["components"]:
-            comp_props = self.categorized["components"].copy()
-            if "Hook" in defs:
-                comp_props["hooks"] = {
-                    "type": "object",
-                    "description": "Component lifecycle hooks",
-                    "additionalProperties": {"$ref": "#/$defs/Hook"},
-                }
+        if self.categorized.components:
             defs["Component"] = SchemaDefinition(
                 name="Component",
                 description="Snap component definition",
-                properties=comp_props,
+                properties=(
+                    {
+                        **self.categorized.components,
+                        "hooks": {
+                            "type": "object",
+                            "description": "Component lifecycle hooks",
+                            "additionalProperties": {"$ref": "#/$defs/Hook"},
+                        },
+                    }
+                    if "Hook" in defs
+                    else self.categorized.components
+                ),
                 additional_properties=False,
             ).to_json_schema()
 
         # App definition (needs sockets reference)
-        if self.categorized["apps"]:
-            app_props = self.categorized["apps"].copy()
-            if "Socket" in defs:
-                app_props["sockets"] = {
-                    "type": "object",
-                    "description": "Socket activation configuration",
-                    "additionalProperties": {"$ref": "#/$defs/Socket"},
-                }
+        if self.categorized.apps:
             defs["App"] = SchemaDefinition(
                 name="App",
                 description="Application definition",
-                properties=app_props,
+                properties=(
+                    {
+                        **self.categorized.apps,
+                        "sockets": {
+                            "type": "object",
+                            "description": "Socket activation configuration",
+                            "additionalProperties": {"$ref": "#/$defs/Socket"},
+                        },
+                    }
+                    if "Socket" in defs
+                    else self.categorized.apps
+                ),
                 additional_properties=False,
             ).to_json_schema()
 
         # Part definition (needs permissions reference)
-        if self.categorized["parts"]:
-            part_props = self.categorized["parts"].copy()
-            if "Permissions" in defs:
-                part_props["permissions"] = {
-                    "type": "array",
-                    "description": "File permission settings",
-                    "items": {"$ref": "#/$defs/Permissions"},
-                }
+        if self.categorized.parts:
             defs["Part"] = SchemaDefinition(
                 name="Part",
                 description="Part definition for building snap components",
-                properties=part_props,
+                properties=(
+                    {
+                        **self.categorized.parts,
+                        "permissions": {
+                            "type": "array",
+                            "description": "File permission settings",
+                            "items": {"$ref": "#/$defs/Permissions"},
+                        },
+                    }
+                    if "Permissions" in defs
+                    else self.categorized.parts
+                ),
                 additional_properties=True,  # Allow plugin-specific properties
             ).to_json_schema()
 
@@ -810,18 +1066,10 @@ class SchemaBuilder:
 
     def _build_top_level(self, defs: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
         """Build top-level properties with references to definitions."""
-        top_level = self.categorized["top_level"].copy()
-
-        # Map top-level keys to their definitions
-        ref_mappings = [
-            ("apps", "App", "Application definitions"),
-            ("parts", "Part", "Part definitions for building the snap"),
-            ("hooks", "Hook", "Lifecycle hooks"),
-            ("components", "Component", "Snap components"),
-        ]
+        top_level = self.categorized.top_level.copy()
 
-        for key, def_name, description in ref_mappings:
-            if def_name in defs or self.categorized.get(key.rstrip("s"), {}):
+        for key, def_name, description in self.REF_MAPPINGS:
+            if def_name in defs or getattr(self.categorized, key.rstrip("s"), None):
                 top_level[key] = {
                     "type": "object",
                     "description": description,
@@ -832,7 +1080,7 @@ class SchemaBuilder:
                 }
 
         # Platforms with null option for shorthand
-        if "Platform" in defs or self.categorized["platforms"]:
+        if "Platform" in defs or self.categorized.platforms:
             top_level["platforms"] = {
                 "type": "object",
                 "description": "Platform/architecture configurations",
@@ -845,7 +1093,7 @@ class SchemaBuilder:
             }
 
         # Architectures (array with string or object)
-        if "Architecture" in defs or self.categorized["architectures"]:
+        if "Architecture" in defs or self.categorized.architectures:
             top_level["architectures"] = {
                 "type": "array",
                 "description": "Architecture configurations (for core22 and older)",
@@ -882,6 +1130,8 @@ class SchemaBuilder:
 class SchemaEnhancer:
     """Enhances schema with dynamically parsed enum values."""
 
+    __slots__ = ("schema", "plugins", "bases", "extensions", "interfaces")
+
     def __init__(
         self,
         schema: dict[str, Any],
@@ -897,71 +1147,101 @@ class SchemaEnhancer:
         self.interfaces = interfaces
 
     def enhance(self) -> dict[str, Any]:
-        """Apply all enhancements to the schema."""
-        print("\n🎨 Enhancing schema with parsed enum values...")
-
-        self._enhance_plugins()
-        self._enhance_bases()
-        self._enhance_extensions()
-        self._enhance_interfaces()
-        self._enhance_architectures()
-
-        print("✅ Schema enhancement complete!\n")
-        return self.schema
-
-    def _enhance_plugins(self) -> None:
-        """Add plugin enum to Part definition."""
-        if not self.plugins:
-            return
+        """Apply all enhancements to the schema in a single pass.
 
-        part_def = self.schema.get("$defs", {}).get("Part", {})
-        if "plugin" in part_def.get("properties", {}):
-            part_def["properties"]["plugin"]["enum"] = self.plugins
-            print(f"  ✓ Added {len(self.plugins)} plugin names")
-
-    def _enhance_bases(self) -> None:
-        """Add base enums to base and build-base properties."""
-        if not self.bases:
-            return
-
-        props = self.schema.get("properties", {})
-
-        if "base" in props:
-            props["base"]["enum"] = self.bases
-            print(f"  ✓ Added {len(self.bases)} base snap names")
-
-        if "build-base" in props:
-            build_bases = self.bases + (["devel"] if "devel" not in self.bases else [])
-            props["build-base"]["enum"] = build_bases
-
-    def _enhance_extensions(self) -> None:
-        """Add extension enum to App definition."""
-        if not self.extensions:
-            return
-
-        app_def = self.schema.get("$defs", {}).get("App", {})
-        app_props = app_def.get("properties", {})
-
-        if "extensions" in app_props:
+        The subtrees being enhanced are looked up once up front and shared by
+        every enhancement below.
+        """
+        logger.info("\n🎨 Enhancing schema with parsed enum values...")
+
+        # SchemaBuilder.build always emits properties; $defs only when non-empty
+        props = self.schema["properties"]
+        defs = self.schema.get("$defs")
+        part_def = defs.get("Part") if defs else None
+        app_def = defs.get("App") if defs else None
+        part_props = part_def["properties"] if part_def else None
+        app_props = app_def["properties"] if app_def else None
+
+        # Plugins: enum on the Part definition
+        if self.plugins and part_props and "plugin" in part_props:
+            part_props["plugin"]["enum"] = self.plugins
+            logger.info(f"  ✓ Added {len(self.plugins)} plugin names")
+
+        # Bases: enums on base and build-base
+        if self.bases:
+            if "base" in props:
+                props["base"]["enum"] = self.bases
+                logger.info(f"  ✓ Added {len(self.bases)} base snap names")
+
+            if "build-base" in props:
+                build_bases = self.bases if "devel" in self.bases else [*self.bases, "devel"]
+                props["build-base"]["enum"] = build_bases
+
+        # Extensions: enum on the App definition
+        if self.extensions and app_props and "extensions" in app_props:
             ext_schema = app_props["extensions"]
             if ext_schema.get("type") == "array":
                 ext_schema["items"] = {"type": "string", "enum": self.extensions}
             else:
                 ext_schema["enum"] = self.extensions
-            print(f"  ✓ Added {len(self.extensions)} extension names")
+            logger.info(f"  ✓ Added {len(self.extensions)} extension names")
+
+        # Interfaces: plugs and slots
+        if self.interfaces:
+            self._enhance_interfaces(self.schema.setdefault("$defs", {}), props, app_props)
+
+        # Architectures: static enum shared by architectures items and platform names
+        archs = sorted(VALID_ARCHITECTURES)
+        arch_ref = {"$ref": "#/$defs/ArchitectureName"}
+        uses_archs = False
+        if "architectures" in props:
+            arch_def = props["architectures"]
+            if "items" in arch_def and "anyOf" in arch_def["items"]:
+                any_of = arch_def["items"]["anyOf"]
+                for i, item in enumerate(any_of):
+                    if item.get("type") == "string":
+                        any_of[i] = arch_ref
+                        uses_archs = True
+                        logger.info(f"  ✓ Added {len(archs)} architecture names")
+                        break
+
+        # Platform property names
+        if "platforms" in props:
+            props["platforms"]["propertyNames"] = arch_ref
+            uses_archs = True
+
+        if uses_archs:
+            self.schema.setdefault("$defs", {})["ArchitectureName"] = {
+                "type": "string",
+                "enum": archs,
+            }
 
-    def _enhance_interfaces(self) -> None:
+        logger.info("✅ Schema enhancement complete!\n")
+        return self.schema
+
+    def _enhance_interfaces(
+        self,
+        defs: dict[str, Any],
+        props: dict[str, Any],
+        app_props: dict[str, Any] | None,
+    ) -> None:
         """Add interface definitions to plugs and slots.
 
         Plugs and slots use custom names as property keys (e.g., 'dbus-svc', 'foo-plug').
         The 'interface' property inside each plug/slot specifies the interface type.
-        """
-        if not self.interfaces:
-            return
 
-        print(f"  ✓ Added {len(self.interfaces)} interface names")
+        The interface enum and the plug/slot value schema are stored once in
+        $defs (InterfaceName, PlugSlotValue) and referenced everywhere else.
+
+        Args:
+            defs: The schema's $defs
+            props: Top-level schema properties
+            app_props: Properties of the App definition, if there is one
+        """
+        logger.info(f"  ✓ Added {len(self.interfaces)} interface names")
 
-        props = self.schema.get("properties", {})
+        defs["InterfaceName"] = {"type": "string", "enum": self.interfaces}
+        interface_ref = {"$ref": "#/$defs/InterfaceName"}
 
         # Define the schema for plug/slot definitions (allows custom property names)
         # The interface type is specified via the 'interface' property inside
@@ -973,8 +1253,7 @@ class SchemaEnhancer:
                     "type": "object",
                     "properties": {
                         "interface": {
-                            "type": "string",
-                            "enum": self.interfaces,
+                            "$ref": "#/$defs/InterfaceName",
                             "description": "The interface type for this plug/slot."
                         },
                         "bus": {
@@ -1003,42 +1282,92 @@ class SchemaEnhancer:
                 }
             ]
         }
+        defs["PlugSlotValue"] = plug_slot_value_schema
 
         # Top-level plugs/slots allow custom names as keys (no propertyNames restriction)
-        for key in ["plugs", "slots"]:
+        iface_preview = ", ".join(self.interfaces[:25])
+        for key in ("plugs", "slots"):
             if key in props:
                 props[key] = {
                     "type": "object",
-                    "description": f"Declares the snap's {key}. Property names are custom identifiers.\n\nAvailable interfaces: {', '.join(self.interfaces[:25])}...",
-                    "additionalProperties": plug_slot_value_schema
+                    "description": f"Declares the snap's {key}. Property names are custom identifiers.\n\nAvailable interfaces: {iface_preview}...",
+                    "additionalProperties": {"$ref": "#/$defs/PlugSlotValue"}
                 }
 
         # App-level plugs/slots are arrays of interface names (strings)
-        app_def = self.schema.get("$defs", {}).get("App", {})
-        app_props = app_def.get("properties", {})
-        if "plugs" in app_props and app_props["plugs"].get("type") == "array":
-            app_props["plugs"]["items"] = {"type": "string", "enum": self.interfaces}
-        if "slots" in app_props and app_props["slots"].get("type") == "array":
-            app_props["slots"]["items"] = {"type": "string", "enum": self.interfaces}
-
-    def _enhance_architectures(self) -> None:
-        """Add architecture enum to relevant fields."""
-        archs = sorted(VALID_ARCHITECTURES)
-        props = self.schema.get("properties", {})
+        if app_props:
+            if "plugs" in app_props and app_props["plugs"].get("type") == "array":
+                app_props["plugs"]["items"] = interface_ref
+            if "slots" in app_props and app_props["slots"].get("type") == "array":
+                app_props["slots"]["items"] = interface_ref
 
-        # Architectures array items
-        if "architectures" in props:
-            arch_def = props["architectures"]
-            if "items" in arch_def and "anyOf" in arch_def["items"]:
-                for item in arch_def["items"]["anyOf"]:
-                    if item.get("type") == "string":
-                        item["enum"] = archs
-                        print(f"  ✓ Added {len(archs)} architecture names")
-                        break
 
-        # Platform property names
-        if "platforms" in props:
-            props["platforms"]["propertyNames"] = {"enum": archs}
+# =============================================================================
+# Build Stamp
+# =============================================================================
+
+class BuildStamp:
+    """Records which upstream sources and script produced the current schema.
+
+    With the on-disk cache enabled, a run whose sources were all answered
+    304 Not Modified can then skip parsing and building entirely.
+    """
+
+    PATH = HTTPClient.CACHE_DIR / "build-stamp.json"
+
+    @classmethod
+    def is_current(cls, schema_output: Path, pages: dict[str, Future[bytes]]) -> bool:
+        """Check whether the schema on disk was built from unchanged sources.
+
+        Waits for the remaining downloads only while every source so far has
+        been answered 304 Not Modified.
+
+        Args:
+            schema_output: Path of the generated schema
+            pages: Futures of every fetched source, keyed by URL
+
+        Returns:
+            True if rebuilding would reproduce the existing schema
+        """
+        if not HTTPClient.CACHE_ENABLED or not schema_output.exists():
+            return False
+        for url, page in pages.items():
+            HTTPClient.result(page)
+            if not HTTPClient.not_modified(url):
+                return False
+
+        try:
+            stamp = json.loads(cls.PATH.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return False
+        return stamp == cls._describe(schema_output, pages)
+
+    @classmethod
+    def record(cls, schema_output: Path, pages: dict[str, Future[bytes]]) -> None:
+        """Store the stamp for a schema that matches the fetched sources.
+
+        Args:
+            schema_output: Path of the generated schema
+            pages: Futures of every fetched source, keyed by URL
+        """
+        if not HTTPClient.CACHE_ENABLED:
+            return
+        try:
+            cls.PATH.parent.mkdir(parents=True, exist_ok=True)
+            cls.PATH.write_text(json.dumps(cls._describe(schema_output, pages)), encoding="utf-8")
+        except OSError as e:
+            logger.warning(f"   ⚠️  Failed to write build stamp: {e}")
+
+    @staticmethod
+    def _describe(schema_output: Path, pages: dict[str, Future[bytes]]) -> dict[str, Any]:
+        """Summarize the script, the schema and the source validators."""
+        with schema_output.open("rb") as f:
+            schema_digest = hashlib.file_digest(f, "sha256").hexdigest()
+        return {
+            "script": hashlib.sha256(Path(__file__).read_bytes()).hexdigest(),
+            "schema": schema_digest,
+            "sources": {url: list(HTTPClient.validators(url) or ()) for url in pages},
+        }
 
 
 # =============================================================================
@@ -1052,10 +1381,19 @@ def main() -> int:
     If this script fails, it means the documentation structure has changed.
     Update the parsing logic to match the new structure.
     """
-    print("=" * 60)
-    print("Snapcraft Schema Sync Tool v2.0")
-    print("Parsing from official documentation - NO FALLBACKS")
-    print("=" * 60)
+    # Configure only this script's logger so library INFO records (e.g. urllib3's
+    # "Redirecting ..." lines) stay off the console
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+
+    logger.info("=" * 60)
+    logger.info("Snapcraft Schema Sync Tool v2.0")
+    logger.info("Parsing from official documentation - NO FALLBACKS")
+    logger.info("=" * 60)
 
     urls = DocumentationURLs()
     thresholds = ValidationThresholds()
@@ -1065,80 +1403,109 @@ def main() -> int:
     project_root = script_dir.parent
     schema_output = project_root / "schemas" / "snapcraft.json"
 
-    # Fetch and parse main documentation
-    html_content = HTTPClient.fetch(urls.main)
-    print(f"✓ Fetched {len(html_content)} bytes of HTML\n")
+    # Start every download now so the enum pages overlap with parsing the main page
+    pages = HTTPClient.prefetch([
+        urls.main,
+        urls.plugins,
+        urls.bases,
+        urls.extensions,
+        urls.interfaces,
+        ExtensionParser.REGISTRY_URL,
+        ExtensionParser.LEGACY_SCHEMA_URL,
+    ])
+
+    # Skip the whole build when no source changed since the schema was written
+    if BuildStamp.is_current(schema_output, pages):
+        logger.info("💚 Sources unchanged since the last sync. No changes needed.")
+        return 0
+
+    # Parse main documentation
+    html_content = HTTPClient.result(pages[urls.main])
+    logger.info(f"✓ Fetched {len(html_content)} bytes of HTML\n")
 
     extractor = PropertyExtractor(html_content)
     properties = extractor.extract_all()
-    print(f"✓ Extracted {len(properties)} property definitions\n")
+    logger.info(f"✓ Extracted {len(properties)} property definitions\n")
 
     if len(properties) < thresholds.properties:
-        print(f"❌ Only extracted {len(properties)} properties, expected at least {thresholds.properties}")
+        logger.error(f"❌ Only extracted {len(properties)} properties, expected at least {thresholds.properties}")
         sys.exit(1)
 
+    # Stop here rather than after parsing further pages if any download failed
+    wait(pages.values(), return_when=FIRST_EXCEPTION)
+    for page in pages.values():
+        if page.done():
+            HTTPClient.result(page)
+
     # Build initial schema
     builder = SchemaBuilder(properties, urls.main)
     schema = builder.build()
 
     prop_count = len(schema.get("properties", {}))
     defs_count = len(schema.get("$defs", {}))
-    print(f"✓ Generated schema: {prop_count} top-level properties, {defs_count} definitions\n")
+    logger.info(f"✓ Generated schema: {prop_count} top-level properties, {defs_count} definitions\n")
 
     # Fetch dynamic enum values
-    print("=" * 60)
-    print("Fetching dynamic enum values from documentation...")
-    print("=" * 60 + "\n")
+    logger.info("=" * 60)
+    logger.info("Fetching dynamic enum values from documentation...")
+    logger.info("=" * 60 + "\n")
 
-    plugins_html = HTTPClient.fetch(urls.plugins)
+    plugins_html = HTTPClient.result(pages[urls.plugins])
     plugins = PluginParser.parse(plugins_html, thresholds.plugins)
-    print(f"✅ Parsed {len(plugins)} plugins\n")
+    logger.info(f"✅ Parsed {len(plugins)} plugins\n")
 
-    bases_html = HTTPClient.fetch(urls.bases)
+    bases_html = HTTPClient.result(pages[urls.bases])
     bases = BaseParser.parse(bases_html, thresholds.bases)
-    print(f"✅ Parsed {len(bases)} bases\n")
+    logger.info(f"✅ Parsed {len(bases)} bases\n")
 
-    extensions_html = HTTPClient.fetch(urls.extensions)
+    extensions_html = HTTPClient.result(pages[urls.extensions])
     extensions = ExtensionParser.parse(extensions_html, thresholds.extensions)
-    print(f"✅ Parsed {len(extensions)} extensions\n")
+    logger.info(f"✅ Parsed {len(extensions)} extensions\n")
 
-    interfaces_html = HTTPClient.fetch(urls.interfaces)
+    interfaces_html = HTTPClient.result(pages[urls.interfaces])
     interfaces = InterfaceParser.parse(interfaces_html, thresholds.interfaces)
-    print(f"✅ Parsed {len(interfaces)} interfaces\n")
+    logger.info(f"✅ Parsed {len(interfaces)} interfaces\n")
 
     # Enhance schema with dynamic values
     enhancer = SchemaEnhancer(schema, plugins, bases, extensions, interfaces)
     schema = enhancer.enhance()
 
-    # Write schema
-    new_content = json.dumps(schema, indent=2, ensure_ascii=False) + "\n"
+    # Serialize once, straight to UTF-8 bytes (same layout as json.dumps(indent=2))
+    new_content = orjson.dumps(schema, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
 
+    # A size mismatch already proves a change; otherwise compare digests so the
+    # existing file is streamed through the hash without being read into memory
     if schema_output.exists():
-        current_content = schema_output.read_text(encoding="utf-8")
-        if current_content == new_content:
-            print("💚 Schema is already up to date. No changes needed.")
+        unchanged = schema_output.stat().st_size == len(new_content)
+        if unchanged:
+            with schema_output.open("rb") as f:
+                unchanged = hashlib.file_digest(f, "sha256").digest() == hashlib.sha256(new_content).digest()
+        if unchanged:
+            logger.info("💚 Schema is already up to date. No changes needed.")
+            BuildStamp.record(schema_output, pages)
             return 0
-        print("🔄 Schema has changed. Updating...")
+        logger.info("🔄 Schema has changed. Updating...")
 
-    print(f"Writing schema to {schema_output}")
+    logger.info(f"Writing schema to {schema_output}")
     schema_output.parent.mkdir(parents=True, exist_ok=True)
-    schema_output.write_text(new_content, encoding="utf-8", newline="\n")
-    print("✅ Schema updated successfully!")
+    schema_output.write_bytes(new_content)
+    BuildStamp.record(schema_output, pages)
+    logger.info("✅ Schema updated successfully!")
 
     # Summary
-    print("\nSchema Summary:")
-    print(f"Top-level properties: {prop_count}")
-    print(f"Definitions ($defs): {defs_count}")
-    print(
+    logger.info("\nSchema Summary:")
+    logger.info(f"Top-level properties: {len(schema.get('properties', {}))}")
+    logger.info(f"Definitions ($defs): {len(schema.get('$defs', {}))}")
+    logger.info(
         f"Dynamic enums: plugins({len(plugins)}), bases({len(bases)}), "
         f"extensions({len(extensions)}), interfaces({len(interfaces)})"
     )
 
     if properties := schema.get("properties"):
         sample = list(properties.keys())[:10]
-        print(f"Sample properties: {', '.join(sample)}")
+        logger.info(f"Sample properties: {', '.join(sample)}")
     if defs := schema.get("$defs"):
-        print(f"Definitions: {', '.join(defs.keys())}")
+        logger.info(f"Definitions: {', '.join(defs.keys())}")
     return 0
 
 